@@ -257,9 +257,9 @@ class _XMLObject:
 
         """
         return {
-            key: getattr(self, key)
+            key: value
             for key in self.__kwarg_keys
-            if getattr(self, key) is not None
+            if (value := getattr(self, key)) is not None
         }
 
     @classmethod
@@ -38,7 +38,6 @@ from typing import Sequence
 from typing import Tuple
 from typing import Type
 from typing import Union
-from typing import cast
 
 import pygeoif.geometry as geo
 from pygeoif.exceptions import DimensionError
@@ -97,6 +96,8 @@ MsgMutualExclusive: Final = "Geometry and kml coordinates are mutually exclusive
 
 xml_attrs = {"ns", "name_spaces", "id", "target_id"}
 
+coordinates_comma_space: Final = re.compile(r", +")
+
 
 def handle_invalid_geometry_error(
     *,
@@ -122,6 +123,8 @@ def handle_invalid_geometry_error(
         KMLParseError: If `strict` is True, raise a KMLParseError.
 
     """
+    if not strict and not logger.isEnabledFor(logging.ERROR):
+        return
     error_in_xml = config.etree.tostring(
         element,
         encoding="UTF-8",
@@ -162,16 +165,22 @@ def coordinates_subelement(
         None
 
     """
-    if getattr(obj, attr_name, None):
-        coords = getattr(obj, attr_name)
-        if not coords or len(coords[0]) not in (2, 3):
-            msg = f"Invalid dimensions in coordinates '{coords}'"
-            raise KMLWriteError(msg)
-        if precision is None:
-            tuples = (",".join(str(c) for c in coord) for coord in coords)
-        else:
-            tuples = (",".join(f"{c:.{precision}f}" for c in coord) for coord in coords)
-        element.text = " ".join(tuples)
+    coords = getattr(obj, attr_name, None)
+    if not coords:
+        return
+    if len(coords[0]) not in (2, 3):
+        msg = f"Invalid dimensions in coordinates '{coords}'"
+        raise KMLWriteError(msg)
+    if precision is None:
+        tuples = [",".join(map(str, coord)) for coord in coords]
+    else:
+        float_format = f"%.{precision}f"
+        coord_formats = {
+            dimension: ",".join([float_format] * dimension)
+            for dimension in {len(coord) for coord in coords}
+        }
+        tuples = [coord_formats[len(coord)] % tuple(coord) for coord in coords]
+    element.text = " ".join(tuples)
 
 
 def subelement_coordinates_kwarg(
@@ -206,14 +215,24 @@ def subelement_coordinates_kwarg(
         ValueError: If the coordinates are not in the expected format.
 
     """
+    text = element.text
+    if not text:
+        return {kwarg: []} if text == "" else {}
+    if ", " in text:
+        text = coordinates_comma_space.sub(",", text)
+    latlons = text.split()
+    dimensions = {latlon.count(",") + 1 for latlon in latlons}
     try:
-        latlons = re.sub(r", +", ",", element.text.strip()).split()
-    except AttributeError:
-        return {}
-    try:
+        if len(dimensions) == 1:
+            # All coordinates have the same dimension, convert the values in one
+            # pass and regroup them into tuples.
+            values = map(float, ",".join(latlons).split(","))
+            return {
+                kwarg: list(zip(*[values] * dimensions.pop())),
+            }
         return {
             kwarg: [  # type: ignore[dict-item]
-                tuple(float(c) for c in latlon.split(",")) for latlon in latlons
+                tuple(map(float, latlon.split(","))) for latlon in latlons
             ],
         }
     except ValueError as error:
@@ -797,9 +816,8 @@ class LinearRing(LineString):
         if not self.kml_coordinates:
             return None
         try:
-            return cast(
-                geo.LinearRing,
-                geo.LinearRing.from_coordinates(self.kml_coordinates.coords),
+            return geo.LinearRing.from_coordinates(  # type: ignore[return-value]
+                self.kml_coordinates.coords,
             )
         except DimensionError:
             return None
@@ -1076,18 +1094,16 @@ class Polygon(_Geometry):
             The geometry object representing the geometry of the Polygon.
 
         """
-        if not self.outer_boundary:
+        if self.outer_boundary is None or not (
+            exterior := self.outer_boundary.geometry
+        ):
             return None
-        if not self.inner_boundaries:
-            return geo.Polygon.from_linear_rings(
-                cast(geo.LinearRing, self.outer_boundary.geometry),
-            )
         return geo.Polygon.from_linear_rings(
-            cast(geo.LinearRing, self.outer_boundary.geometry),
+            exterior,
             *[
-                interior.geometry
+                geometry
                 for interior in self.inner_boundaries
-                if interior.geometry is not None
+                if (geometry := interior.geometry) is not None
             ],
         )
 
@@ -1191,6 +1207,13 @@ registry.register(
 )
 
 
+geometries_to_multi_geometry: Final = {
+    geo.Point.__name__: geo.MultiPoint.from_points,
+    geo.LineString.__name__: geo.MultiLineString.from_linestrings,
+    geo.Polygon.__name__: geo.MultiPolygon.from_polygons,
+}
+
+
 def create_multigeometry(
     geometries: Sequence[AnyGeometryType],
 ) -> Optional[MultiGeometryType]:
@@ -1209,18 +1232,12 @@ def create_multigeometry(
     geom_types = {geom.geom_type for geom in geometries}
     if not geom_types:
         return None
-    if len(geom_types) == 1:
-        geom_type = geom_types.pop()
-        map_to_geometries = {
-            geo.Point.__name__: geo.MultiPoint.from_points,
-            geo.LineString.__name__: geo.MultiLineString.from_linestrings,
-            geo.Polygon.__name__: geo.MultiPolygon.from_polygons,
-        }
-        for geometry_name, constructor in map_to_geometries.items():
-            if geom_type == geometry_name:
-                return constructor(  # type: ignore[operator, no-any-return]
-                    *geometries,
-                )
+    if len(geom_types) == 1 and (
+        constructor := geometries_to_multi_geometry.get(geom_types.pop())
+    ):
+        return constructor(  # type: ignore[operator, no-any-return]
+            *geometries,
+        )
 
     return geo.GeometryCollection(geometries)
 
@@ -1337,7 +1354,7 @@ class MultiGeometry(_BaseObject):
     def geometry(self) -> Optional[MultiGeometryType]:
         """Return the geometry of the MultiGeometry."""
         return create_multigeometry(
-            [geom.geometry for geom in self.kml_geometries if geom.geometry],
+            [geometry for geom in self.kml_geometries if (geometry := geom.geometry)],
         )
 
 
@@ -1356,6 +1373,22 @@ registry.register(
 
 KMLGeometryType = Union[Point, LineString, Polygon, LinearRing, MultiGeometry]
 
+geometry_to_kml: Final[
+    Dict[
+        Union[Type[GeoType], Type[GeoCollectionType]],
+        Type[KMLGeometryType],
+    ]
+] = {
+    geo.Point: Point,
+    geo.Polygon: Polygon,
+    geo.LinearRing: LinearRing,
+    geo.LineString: LineString,
+    geo.MultiPoint: MultiGeometry,
+    geo.MultiLineString: MultiGeometry,
+    geo.MultiPolygon: MultiGeometry,
+    geo.GeometryCollection: MultiGeometry,
+}
+
 
 def _unknown_geometry_type(geometry: Union[GeoType, GeoCollectionType]) -> NoReturn:
     """
@@ -1405,31 +1438,17 @@ def create_kml_geometry(
         KML geometry object.
 
     """
-    _map_to_kml: Dict[
-        Union[Type[GeoType], Type[GeoCollectionType]],
-        Type[KMLGeometryType],
-    ] = {
-        geo.Point: Point,
-        geo.Polygon: Polygon,
-        geo.LinearRing: LinearRing,
-        geo.LineString: LineString,
-        geo.MultiPoint: MultiGeometry,
-        geo.MultiLineString: MultiGeometry,
-        geo.MultiPolygon: MultiGeometry,
-        geo.GeometryCollection: MultiGeometry,
-    }
     geom = shape(geometry)
-    for geometry_class, kml_class in _map_to_kml.items():
-        if isinstance(geom, geometry_class):
-            return kml_class(
-                ns=ns,
-                name_spaces=name_spaces,
-                id=id,
-                target_id=target_id,
-                extrude=extrude,
-                tessellate=tessellate,
-                altitude_mode=altitude_mode,
-                geometry=geom,  # type: ignore[arg-type]
-            )
-
-    _unknown_geometry_type(geometry)  # pragma: no cover
+    kml_class = geometry_to_kml.get(type(geom))
+    if kml_class is None:
+        _unknown_geometry_type(geometry)  # pragma: no cover
+    return kml_class(
+        ns=ns,
+        name_spaces=name_spaces,
+        id=id,
+        target_id=target_id,
+        extrude=extrude,
+        tessellate=tessellate,
+        altitude_mode=altitude_mode,
+        geometry=geom,  # type: ignore[arg-type]
+    )
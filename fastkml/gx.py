@@ -87,7 +87,6 @@ from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Tuple
-from typing import cast
 
 import pygeoif.geometry as geo
 from pygeoif.types import PointType
@@ -257,7 +256,7 @@ class Track(_Geometry):
         if not track_items and whens and coords:
             track_items = [
                 TrackItem(
-                    when=cast(KmlDateTime, when),
+                    when=when,  # type: ignore[arg-type]
                     coord=geo.Point(*coord),
                     angle=Angle(*angle),
                 )
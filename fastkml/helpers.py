@@ -40,7 +40,6 @@ from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Type
-from typing import cast
 
 from pygeoif.types import PointType
 
@@ -528,9 +527,10 @@ def datetime_subelement_list(
         verbosity=verbosity,
         default=default,
     ):
+        sub_element = config.etree.SubElement
         for item in value:
             ns = get_ns(obj, item)
-            subelement = config.etree.SubElement(
+            subelement = sub_element(
                 element,
                 f"{ns}{node_name}",
             )
@@ -554,16 +554,17 @@ def coords_subelement_list(
         verbosity=verbosity,
         default=default,
     ):
+        sub_element = config.etree.SubElement
         for coord in value:
             ns = get_ns(obj, coord)
-            subelement = config.etree.SubElement(
+            subelement = sub_element(
                 element,
                 f"{ns}{node_name}",
             )
             if precision is None:
-                subelement.text = " ".join(str(c) for c in coord)
+                subelement.text = " ".join([str(c) for c in coord])
             else:
-                subelement.text = " ".join(f"{c:.{precision}f}" for c in coord)
+                subelement.text = " ".join([f"{c:.{precision}f}" for c in coord])
 
 
 def xml_subelement(
@@ -594,9 +595,9 @@ def xml_subelement(
         None
 
     """
-    if getattr(obj, attr_name, None):
+    if value := getattr(obj, attr_name, None):
         element.append(
-            getattr(obj, attr_name).etree_element(
+            value.etree_element(
                 precision=precision,
                 verbosity=verbosity,
             ),
@@ -631,8 +632,8 @@ def xml_subelement_list(
         None
 
     """
-    if getattr(obj, attr_name, None):
-        for item in getattr(obj, attr_name):
+    if value := getattr(obj, attr_name, None):
+        for item in value:
             if item:
                 element.append(
                     item.etree_element(precision=precision, verbosity=verbosity),
@@ -1167,9 +1168,8 @@ def get_coord_args(
     for subelement in subelements:
         if subelement.text:
             try:
-                yield cast(
-                    PointType,
-                    tuple(float(coord) for coord in subelement.text.split()),
+                yield tuple(  # type: ignore[misc]
+                    map(float, subelement.text.split()),
                 )
             except ValueError as exc:
                 handle_error(
@@ -1272,22 +1272,35 @@ def xml_subelement_list_kwarg(
             argument and its list of subelements.
 
     """
-    args_list = []
     assert node_name is not None  # noqa: S101
     assert name_spaces is not None  # noqa: S101
-    for obj_class in classes:
-        if subelements := element.findall(
-            f"{ns}{obj_class.get_tag_name()}",  # type: ignore[attr-defined]
-        ):
-            args_list.extend(
-                [
-                    obj_class.class_from_element(  # type: ignore[attr-defined]
-                        ns=ns,
-                        name_spaces=name_spaces,
-                        element=subelement,
-                        strict=strict,
-                    )
-                    for subelement in subelements
-                ],
+    tag_classes: Dict[str, Type[object]] = {
+        f"{ns}{obj_class.get_tag_name()}": obj_class  # type: ignore[attr-defined]
+        for obj_class in classes
+    }
+    subelements: Dict[str, List[Element]] = {tag: [] for tag in tag_classes}
+    if len(subelements) == 1:
+        subelements = {tag: list(element.findall(tag)) for tag in subelements}
+    else:
+        # Collect the children for all classes in a single pass over the element,
+        # lxml can filter them by tag before they reach Python.
+        children: Iterable[Element] = (
+            element.iterchildren(*subelements)
+            if hasattr(element, "iterchildren")
+            else element  # type: ignore[assignment]
+        )
+        for child in children:
+            if child.tag in subelements:
+                subelements[child.tag].append(child)
+    return {
+        kwarg: [
+            tag_classes[tag].class_from_element(  # type: ignore[attr-defined]
+                ns=ns,
+                name_spaces=name_spaces,
+                element=subelement,
+                strict=strict,
             )
-    return {kwarg: args_list}
+            for tag, tag_subelements in subelements.items()
+            for subelement in tag_subelements
+        ],
+    }
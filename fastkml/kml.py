@@ -171,6 +171,7 @@ class KML(_XMLObject):
         # self.ns may be empty, which leads to unprefixed kml elements.
         # However, in this case the xlmns should still be mentioned on the kml
         # element, just without prefix.
+        root: Element
         if not self.ns:
             root = config.etree.Element(
                 f"{self.ns}{self.get_tag_name()}",
@@ -194,7 +195,7 @@ class KML(_XMLObject):
             verbosity=verbosity,
             default=None,
         )
-        return cast(Element, root)
+        return root
 
     def append(
         self,
@@ -120,6 +120,7 @@ class Registry:
     """
 
     _registry: Dict[Type["_XMLObject"], List[RegistryItem]]
+    _cache: Dict[Type["_XMLObject"], List[RegistryItem]]
 
     def __init__(
         self,
@@ -127,6 +128,7 @@ class Registry:
     ) -> None:
         """Initialize the registry."""
         self._registry = registry or {}
+        self._cache = {}
 
     def __repr__(self) -> str:
         """Create a string (c)representation for Registry."""
@@ -154,6 +156,7 @@ class Registry:
         existing = self._registry.get(cls, [])
         existing.append(item)
         self._registry[cls] = existing
+        self._cache.clear()
 
     def get(self, cls: Type["_XMLObject"]) -> List[RegistryItem]:
         """
@@ -171,12 +174,17 @@ class Registry:
         It allows ``_XMLObject`` to handle different KML elements consistently while
         respecting their inheritance structure.
 
+        The result is cached per class until the next call to ``register``,
+        the returned list must not be modified.
+
         """
-        parents = reversed(cls.__mro__[:-1])
-        items = []
-        for parent in parents:
-            items.extend(self._registry.get(parent, []))
-        return items
+        if cls not in self._cache:
+            parents = reversed(cls.__mro__[:-1])
+            items = []
+            for parent in parents:
+                items.extend(self._registry.get(parent, []))
+            self._cache[cls] = items
+        return self._cache[cls]
 
 
 registry = Registry()
@@ -63,6 +63,35 @@ class TestCoordinates(StdLibrary):
             (-123.940449937288, 49.16927524669021, 17.0),
         ]
 
+    def test_coordinates_from_string_with_space_after_comma(self) -> None:
+        """Test the from_string method with spaces after the commas."""
+        coordinates = Coordinates.from_string(
+            '<kml:coordinates xmlns:kml="http://www.opengis.net/kml/2.2">'
+            "1.0, 2.0,  3.0 4.0,5.0,   6.0"
+            "</kml:coordinates>",
+        )
+
+        assert coordinates.coords == [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)]
+
+    def test_coordinates_from_string_mixed_dimensions(self) -> None:
+        """Test the from_string method with 2D and 3D coordinates mixed."""
+        coordinates = Coordinates.from_string(
+            '<kml:coordinates xmlns:kml="http://www.opengis.net/kml/2.2">'
+            "1,2,3 4,5 6,7,8,9"
+            "</kml:coordinates>",
+        )
+
+        assert coordinates.coords == [(1, 2, 3), (4, 5), (6, 7, 8, 9)]
+
+    def test_coordinates_from_string_empty(self) -> None:
+        """Test the from_string method with an empty element."""
+        coordinates = Coordinates.from_string(
+            '<kml:coordinates xmlns:kml="http://www.opengis.net/kml/2.2" />',
+        )
+
+        assert coordinates.coords == []
+        assert not coordinates
+
     def test_coordinates_from_string_parse_error_relaxed(self) -> None:
         """Test the from_string method with a parse error."""
         coordinates = Coordinates.from_string(
@@ -15,17 +15,20 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
 """Test the geometry error handling."""
 
+import logging
 from typing import Callable
 from unittest.mock import Mock
 from unittest.mock import patch
 
 import pytest
 
+from fastkml import config
 from fastkml.enums import Verbosity
 from fastkml.exceptions import KMLParseError
 from fastkml.exceptions import KMLWriteError
 from fastkml.geometry import coordinates_subelement
 from fastkml.geometry import handle_invalid_geometry_error
+from fastkml.geometry import subelement_coordinates_kwarg
 from tests.base import StdLibrary
 
 
@@ -68,6 +71,23 @@ class TestGeometryFunctions(StdLibrary):
             encoding="UTF-8",
         )
 
+    @patch("fastkml.config.etree.tostring", return_value=b"<kml:... />")
+    @patch("fastkml.geometry.logger.isEnabledFor", return_value=False)
+    def test_handle_invalid_geometry_error_false_logging_disabled(
+        self,
+        mock_is_enabled_for: Callable[..., bool],
+        mock_to_string: Callable[..., str],
+    ) -> None:
+        handle_invalid_geometry_error(
+            error=ValueError(),
+            element=Mock(),
+            strict=False,
+        )
+        mock_is_enabled_for.assert_called_once_with(  # type: ignore[attr-defined]
+            logging.ERROR,
+        )
+        mock_to_string.assert_not_called()  # type: ignore[attr-defined]
+
     def test_coordinates_subelement_exception(self) -> None:
         obj = Mock()
         obj.coordinates = [(1.123456, 2.654321, 3.111111, 4.222222)]
@@ -87,3 +107,47 @@ class TestGeometryFunctions(StdLibrary):
                 verbosity=Verbosity.terse,
                 default=None,
             )
+
+    def test_subelement_coordinates_kwarg_no_text(self) -> None:
+        element = config.etree.Element("coordinates")
+
+        assert (
+            subelement_coordinates_kwarg(
+                element=element,
+                ns="",
+                name_spaces={},
+                node_name="coordinates",
+                kwarg="coords",
+                classes=(),
+                strict=True,
+            )
+            == {}
+        )
+
+    def test_subelement_coordinates_kwarg_empty_text(self) -> None:
+        element = config.etree.Element("coordinates")
+        element.text = ""
+
+        assert subelement_coordinates_kwarg(
+            element=element,
+            ns="",
+            name_spaces={},
+            node_name="coordinates",
+            kwarg="coords",
+            classes=(),
+            strict=True,
+        ) == {"coords": []}
+
+    def test_subelement_coordinates_kwarg_whitespace_text(self) -> None:
+        element = config.etree.Element("coordinates")
+        element.text = " \n\t "
+
+        assert subelement_coordinates_kwarg(
+            element=element,
+            ns="",
+            name_spaces={},
+            node_name="coordinates",
+            kwarg="coords",
+            classes=(),
+            strict=True,
+        ) == {"coords": []}
@@ -43,8 +43,8 @@ class TestLxml(Lxml):
     @given(
         href=urls(),
         rel=st.one_of(st.none(), xml_text()),
-        type=st.one_of(st.none(), media_types()),
-        hreflang=st.one_of(st.none(), href_langs()),
+        type=st.one_of(st.none(), media_types),
+        hreflang=st.one_of(st.none(), href_langs),
         title=st.one_of(st.none(), xml_text()),
         length=st.one_of(st.none(), st.integers()),
     )
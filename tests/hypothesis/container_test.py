@@ -129,7 +129,7 @@ class TestLxml(Lxml):
         schemata=st.lists(
             st.builds(
                 fastkml.data.Schema,
-                id=nc_name(),
+                id=nc_name,
             ),
             max_size=1,
         ),
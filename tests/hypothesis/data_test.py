@@ -66,7 +66,7 @@ class TestLxml(Lxml):
         assert_str_roundtrip_verbose(simple_field)
 
     @given(
-        id=nc_name(),
+        id=nc_name,
         name=st.one_of(st.none(), xml_text()),
         fields=st.one_of(st.none(), st.lists(simple_fields())),
     )
@@ -88,8 +88,8 @@ class TestLxml(Lxml):
         assert_str_roundtrip_verbose(schema)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         name=st.one_of(st.none(), xml_text()),
         value=xml_text().filter(lambda x: x.strip() != ""),
         display_name=st.one_of(st.none(), xml_text()),
@@ -135,8 +135,8 @@ class TestLxml(Lxml):
         assert_str_roundtrip_verbose(simple_data)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         schema_url=st.one_of(st.none(), urls()),
         data=st.one_of(
             st.none(),
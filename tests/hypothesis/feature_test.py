@@ -207,8 +207,8 @@ class TestLxml(Lxml):
         assert_str_roundtrip_verbose(placemark)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         name=st.one_of(st.none(), xml_text()),
         visibility=st.one_of(st.none(), st.booleans()),
         isopen=st.one_of(st.none(), st.booleans()),
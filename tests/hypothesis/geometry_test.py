@@ -63,8 +63,8 @@ coordinates = partial(
 
 common_geometry = partial(
     given,
-    id=st.one_of(st.none(), nc_name()),
-    target_id=st.one_of(st.none(), nc_name()),
+    id=st.one_of(st.none(), nc_name),
+    target_id=st.one_of(st.none(), nc_name),
     extrude=st.one_of(st.none(), st.booleans()),
     tessellate=st.one_of(st.none(), st.booleans()),
     altitude_mode=st.one_of(
@@ -38,8 +38,8 @@ from tests.hypothesis.strategies import xml_text
 
 class TestGx(Lxml):
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         altitude_mode=st.one_of(st.none(), st.sampled_from(fastkml.enums.AltitudeMode)),
         track_items=st.one_of(
             st.none(),
@@ -94,8 +94,8 @@ class TestGx(Lxml):
         assert_str_roundtrip_verbose(track)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         altitude_mode=st.one_of(st.none(), st.sampled_from(fastkml.enums.AltitudeMode)),
         tracks=st.one_of(
             st.none(),
@@ -37,8 +37,8 @@ from tests.hypothesis.strategies import query_strings
 
 common_link = partial(
     given,
-    id=st.one_of(st.none(), nc_name()),
-    target_id=st.one_of(st.none(), nc_name()),
+    id=st.one_of(st.none(), nc_name),
+    target_id=st.one_of(st.none(), nc_name),
     href=st.one_of(st.none(), urls()),
     refresh_mode=st.one_of(st.none(), st.sampled_from(fastkml.enums.RefreshMode)),
     refresh_interval=st.one_of(
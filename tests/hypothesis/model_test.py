@@ -181,8 +181,8 @@ class TestLxml(Lxml):
         assert_str_roundtrip_verbose(resource_map)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         altitude_mode=st.one_of(st.none(), st.sampled_from(fastkml.enums.AltitudeMode)),
         location=st.one_of(
             st.none(),
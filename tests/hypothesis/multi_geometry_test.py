@@ -60,8 +60,8 @@ eval_locals = {
 
 common_geometry = partial(
     given,
-    id=st.one_of(st.none(), nc_name()),
-    target_id=st.one_of(st.none(), nc_name()),
+    id=st.one_of(st.none(), nc_name),
+    target_id=st.one_of(st.none(), nc_name),
     extrude=st.one_of(st.none(), st.booleans()),
     tessellate=st.one_of(st.none(), st.booleans()),
     altitude_mode=st.one_of(
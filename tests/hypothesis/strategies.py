@@ -17,11 +17,12 @@
 """Custom hypothesis strategies for testing."""
 
 import datetime
+import operator
 import re
 import string
 from functools import partial
 from typing import Final
-from urllib.parse import urlencode
+from urllib.parse import quote_plus
 
 from hypothesis import strategies as st
 from hypothesis.extra.dateutil import timezones
@@ -36,26 +37,31 @@ from fastkml.views import LatLonAltBox
 from fastkml.views import Lod
 
 ID_TEXT: Final = string.ascii_letters + string.digits + ".-_"
+ID_ALPHABET: Final = st.sampled_from(ID_TEXT)
 
-nc_name = partial(
-    st.from_regex,
-    regex=re.compile(r"^[A-Za-z_][\w.-]*$"),
-    alphabet=ID_TEXT,
-    fullmatch=True,
+nc_name: Final = st.builds(
+    operator.add,
+    st.sampled_from(f"{string.ascii_letters}_"),
+    st.text(alphabet=ID_ALPHABET),
 )
 
-href_langs = partial(
-    st.from_regex,
-    regex=re.compile(r"^[a-zA-Z]{1,8}(-[a-zA-Z0-9]{1,8})?$"),
-    alphabet=f"{string.ascii_letters}-{string.digits}",
-    fullmatch=True,
+href_langs: Final = st.builds(
+    operator.add,
+    st.text(alphabet=string.ascii_letters, min_size=1, max_size=8),
+    st.one_of(
+        st.just(""),
+        st.text(
+            alphabet=f"{string.ascii_letters}{string.digits}",
+            min_size=1,
+            max_size=8,
+        ).map("-{}".format),
+    ),
 )
 
-media_types = partial(
-    st.from_regex,
-    regex=re.compile(r"^[a-zA-Z0-9-]+/[a-zA-Z0-9-]+$"),
-    alphabet=f"{string.ascii_letters}/-{string.digits}",
-    fullmatch=True,
+media_types: Final = st.builds(
+    "{}/{}".format,
+    st.text(alphabet=f"{string.ascii_letters}-{string.digits}", min_size=1),
+    st.text(alphabet=f"{string.ascii_letters}-{string.digits}", min_size=1),
 )
 
 xml_text = partial(
@@ -190,9 +196,13 @@ xy = partial(
 @st.composite
 def query_strings(draw: st.DrawFn) -> str:
     params = draw(
-        st.dictionaries(
-            keys=st.text(alphabet=string.ascii_letters, min_size=1),
-            values=st.text(alphabet=string.printable),
+        st.lists(
+            st.tuples(
+                st.text(alphabet=string.ascii_letters, min_size=1),
+                st.text(alphabet=string.printable),
+            ),
         ),
     )
-    return urlencode(params)
+    return "&".join(
+        [f"{quote_plus(key)}={quote_plus(value)}" for key, value in params],
+    )
@@ -79,8 +79,8 @@ class TestLxml(Lxml):
         assert_str_roundtrip_verbose(hot_spot)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         color=st.one_of(st.none(), kml_colors()),
         color_mode=st.one_of(st.none(), st.sampled_from(fastkml.enums.ColorMode)),
         scale=st.one_of(st.none(), st.floats(allow_nan=False, allow_infinity=False)),
@@ -144,8 +144,8 @@ class TestLxml(Lxml):
         # assert_str_roundtrip_verbose fails at this time
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         color=st.one_of(st.none(), kml_colors()),
         color_mode=st.one_of(st.none(), st.sampled_from(fastkml.enums.ColorMode)),
         width=st.one_of(
@@ -175,8 +175,8 @@ class TestLxml(Lxml):
         assert_str_roundtrip_verbose(line_style)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         color=st.one_of(st.none(), kml_colors()),
         color_mode=st.one_of(st.none(), st.sampled_from(fastkml.enums.ColorMode)),
         fill=st.one_of(st.none(), st.booleans()),
@@ -206,8 +206,8 @@ class TestLxml(Lxml):
         assert_str_roundtrip_verbose(poly_style)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         color=st.one_of(st.none(), kml_colors()),
         color_mode=st.one_of(st.none(), st.sampled_from(fastkml.enums.ColorMode)),
         scale=st.one_of(
@@ -237,8 +237,8 @@ class TestLxml(Lxml):
         assert_str_roundtrip_verbose(label_style)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         bg_color=st.one_of(st.none(), kml_colors()),
         text_color=st.one_of(st.none(), kml_colors()),
         text=st.one_of(st.none(), xml_text()),
@@ -268,8 +268,8 @@ class TestLxml(Lxml):
         assert_str_roundtrip_verbose(balloon_style)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         styles=st.one_of(
             st.none(),
             st.tuples(
@@ -341,8 +341,8 @@ class TestLxml(Lxml):
         # assert_str_roundtrip_verbose disabled because of IconStyle
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         styles=st.one_of(
             st.none(),
             st.tuples(
@@ -400,8 +400,8 @@ class TestLxml(Lxml):
         assert_str_roundtrip_verbose(style)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         key=st.sampled_from(fastkml.enums.PairKey),
         style=st.one_of(
             st.builds(
@@ -433,8 +433,8 @@ class TestLxml(Lxml):
         assert_str_roundtrip_verbose(pair)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         pairs=st.one_of(
             st.none(),
             st.lists(
@@ -473,8 +473,8 @@ class TestLxml(Lxml):
         assert_str_roundtrip_verbose(style_map)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         pairs=st.tuples(
             st.builds(
                 fastkml.styles.Pair,
@@ -39,8 +39,8 @@ from tests.hypothesis.strategies import nc_name
 
 class TestTimes(Lxml):
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         timestamp=st.one_of(st.none(), kml_datetimes()),
     )
     def test_fuzz_time_stamp(
@@ -57,8 +57,8 @@ class TestTimes(Lxml):
         assert_str_roundtrip_verbose(time_stamp)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         begin=st.one_of(st.none(), kml_datetimes()),
         end=st.one_of(st.none(), kml_datetimes()),
     )
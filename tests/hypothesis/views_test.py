@@ -35,8 +35,8 @@ from tests.hypothesis.strategies import nc_name
 
 common_view = partial(
     given,
-    id=st.one_of(st.none(), nc_name()),
-    target_id=st.one_of(st.none(), nc_name()),
+    id=st.one_of(st.none(), nc_name),
+    target_id=st.one_of(st.none(), nc_name),
     longitude=st.one_of(
         st.none(),
         st.floats(
@@ -160,8 +160,8 @@ class TestLxml(Lxml):
         assert_str_roundtrip_verbose(lat_lon_alt_box)
 
     @given(
-        id=st.one_of(st.none(), nc_name()),
-        target_id=st.one_of(st.none(), nc_name()),
+        id=st.one_of(st.none(), nc_name),
+        target_id=st.one_of(st.none(), nc_name),
         lat_lon_alt_box=st.one_of(st.none(), lat_lon_alt_boxes()),
         lod=st.one_of(st.none(), lods()),
     )
@@ -262,3 +262,37 @@ def test_registry_repr() -> None:
     registry = Registry()
 
     assert repr(registry) == "fastkml.registry.Registry({})"
+
+
+def test_registry_get_after_register() -> None:
+    """Test that registering an item invalidates the cached lookups."""
+    registry = Registry()
+    registry.register(
+        A,
+        RegistryItem(
+            ns_ids=("kml",),
+            classes=(A,),
+            attr_name="a",
+            get_kwarg=get_kwarg,
+            set_element=set_element,
+            node_name="a",
+        ),
+    )
+
+    assert len(registry.get(B)) == 1
+
+    registry.register(
+        B,
+        RegistryItem(
+            ns_ids=("kml",),
+            classes=(B,),
+            attr_name="b",
+            get_kwarg=get_kwarg,
+            set_element=set_element,
+            node_name="b",
+        ),
+    )
+
+    assert len(registry.get(A)) == 1
+    assert len(registry.get(B)) == 2
+    assert registry.get(B)[1].attr_name == "b"